@@ -26,7 +26,7 @@ install_requires = [
     "numpy==1.18.1",
     "geopandas==0.7.0",
     "Shapely==1.7.0",
-    "geojson==2.5.0",
+    "pyproj==2.6.0",
     "PyYAML==5.3",
 ]
 
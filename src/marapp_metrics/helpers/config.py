@@ -18,6 +18,7 @@
 """
 
 import functools
+import os
 
 import yaml
 
@@ -25,6 +26,13 @@ from .logging import get_logger
 
 logger = get_logger("config")
 
+# prefer the libyaml-backed loader when PyYAML was built against it
+YAMLLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+# marks a property path missing from the config file
+_MISSING = object()
+
 
 class ConfigurationException(Exception):
     pass
@@ -33,27 +41,70 @@ class ConfigurationException(Exception):
 class Config:
     def __init__(self, config_filepath):
         self._config = self._load_config_object(config_filepath)
+        self._prop_cache = {}
 
     def get_property(self, property_path, default=None):
-        prop = deepgetattr(self._config, property_path, default)
+        # cached per path, the default may be unhashable and is applied after
+        if property_path not in self._prop_cache:
+            self._prop_cache[property_path] = deepgetattr(
+                self._config, property_path, _MISSING
+            )
+
+        prop = self._prop_cache[property_path]
+        if prop is _MISSING:
+            prop = default
         if prop is None:
             raise ConfigurationException(f"Could not get property at: {property_path}")
         return prop
 
     def _load_config_object(self, config_filepath):
-        try:
-            with open(config_filepath, "r") as stream:
-                try:
-                    config = yaml.safe_load(stream)
-                    logger.debug(f"Using earthengine config from: {config_filepath}")
-                    return config
-                except yaml.YAMLError:
-                    raise ConfigurationException(f"Could not decode YAML file: {config_filepath}")
-        except FileNotFoundError:
-            raise ConfigurationException(f"Could not find earthengine config: {config_filepath}")
+        return load_config_file(config_filepath)
+
+
+def get_config(config_filepath):
+    """
+    Returns the Config shared by every caller of the same file,
+    reloaded only when the file is modified.
+    """
+    return _shared_config(*config_file_key(config_filepath))
+
+
+# the only cache layer, bounded so entries for old mtimes are evicted
+@functools.lru_cache(maxsize=16)
+def _shared_config(filepath, mtime):
+    return Config(filepath)
+
+
+def config_file_key(config_filepath):
+    """Returns the (absolute path, modification time) cache key for a config file."""
+
+    filepath = os.path.abspath(config_filepath)
+    try:
+        return filepath, os.path.getmtime(filepath)
+    except FileNotFoundError:
+        raise ConfigurationException(
+            f"Could not find earthengine config: {config_filepath}"
+        )
+
+
+def load_config_file(filepath):
+    """Parses a YAML config file."""
+    try:
+        with open(filepath, "rb") as stream:
+            data = stream.read()
+    except FileNotFoundError:
+        raise ConfigurationException(f"Could not find earthengine config: {filepath}")
+    try:
+        config = yaml.load(data, Loader=YAMLLoader)
+        logger.debug(f"Using earthengine config from: {filepath}")
+        return config
+    except yaml.YAMLError:
+        raise ConfigurationException(f"Could not decode YAML file: {filepath}")
 
 
 def deepgetattr(obj, attr, default=None, sep="."):
     """Recurse through an attribute chain to get the ultimate value."""
 
-    return functools.reduce(lambda o, key: o.get(key, default), attr.split(sep), obj)
+    for key in attr.split(sep):
+        obj = obj.get(key, default) if isinstance(obj, dict) else default
+    return obj
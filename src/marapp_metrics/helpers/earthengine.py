@@ -17,6 +17,7 @@
   specific language governing permissions and limitations under the License.
 """
 
+import functools
 import os
 
 import ee
@@ -24,8 +25,12 @@ import ee
 GOOGLE_SERVICE_ACCOUNT = os.environ.get("GOOGLE_SERVICE_ACCOUNT")
 
 
+@functools.lru_cache(maxsize=1)
 def initialize_google_ee():
-    """Initialize the EE library."""
+    """
+    Initialize the EE library, once per process.
+    A failed initialization is not cached and is retried on the next call.
+    """
 
     if GOOGLE_SERVICE_ACCOUNT:
         credentials = ee.ServiceAccountCredentials(
@@ -36,54 +41,132 @@ def initialize_google_ee():
         ee.Initialize()
 
 
-def map_function(image, scale, reducers, keep_geom, best_effort, max_pixels, band=True):
+@functools.lru_cache(maxsize=1)
+def get_area_km2_image():
+    """
+    Pixel area image in km2, with a single "area" band.
+    Shared by all metrics so the EE graph holds a single area node.
+    """
+    return ee.Image.pixelArea().divide(1e6).rename(["area"])
+
+
+@functools.lru_cache(maxsize=1)
+def get_area_ha_image():
+    """
+    Pixel area image in hectares, with a single "area" band.
+    """
+    return ee.Image.pixelArea().divide(1e4).rename(["area"])
+
+
+@functools.lru_cache(maxsize=1)
+def get_sum_reducer():
+    """
+    Unweighted sum reducer, built once on first use (after ee.Initialize).
+    """
+    return ee.Reducer.sum().unweighted()
+
+
+def fuse_reducers(reducers):
+    """
+    Groups reducer specs sharing the same ee.Reducer so that band keyed images
+    are stacked and reduced together in a single reduceRegion call.
+    :param reducers: dict of key -> {"reducer", "image", "band"}
+    :return: list of {"image", "reducer", "key"} groups, key is None for stacked bands
+    """
+    groups = []
+    stacked = []
+    for key, spec in reducers.items():
+        reducer = spec["reducer"]
+        if not spec.get("band", False):
+            groups.append({"image": spec["image"], "reducer": reducer, "key": key})
+            continue
+
+        image = spec["image"].select([key])
+        for group in stacked:
+            if group["reducer"] == reducer:
+                group["images"].append(image)
+                break
+        else:
+            stacked.append({"images": [image], "reducer": reducer})
+
+    for group in stacked:
+        groups.append(
+            {
+                "image": ee.Image.cat(group["images"]),
+                "reducer": group["reducer"],
+                "key": None,
+            }
+        )
+    return groups
+
+
+def map_function(groups, scale, keep_geom, best_effort, max_pixels):
     def reducer_wrapper(feat):
         geom = feat.geometry()
-        for key, reducer in reducers.items():
-            result = image.reduceRegion(
-                reducer=reducer,
+        for group in groups:
+            result = group["image"].reduceRegion(
+                reducer=group["reducer"],
                 geometry=geom,
                 scale=scale,
                 maxPixels=max_pixels,
                 bestEffort=best_effort,
                 crs="EPSG:4326",
             )
-            if not keep_geom:
-                feat = feat.setGeometry(None)
-            if band:
-                result = result.get(key)
-            feat = feat.set({key: result})
+            if group["key"] is None:
+                # results are keyed by band name
+                feat = feat.set(result)
+            else:
+                feat = feat.set({group["key"]: result})
+        if not keep_geom:
+            feat = feat.setGeometry(None)
         return feat
 
     return reducer_wrapper
 
 
+MASK_OPERATIONS = {
+    "gt": lambda mask_im, v: mask_im.gt(v),
+    "gte": lambda mask_im, v: mask_im.gte(v),
+    "lt": lambda mask_im, v: mask_im.lt(v),
+    "lte": lambda mask_im, v: mask_im.lte(v),
+    "eq": lambda mask_im, v: mask_im.eq(v),
+    "eq_or": lambda mask_im, v: mask_im.eq(v[0]).Or(mask_im.eq(v[1])),
+    "range": lambda mask_im, v: mask_im.gte(v[0]).And(mask_im.lt(v[1])),
+}
+
+
+def make_mask_function(**kwargs):
+    """
+    Resolves the mask operations once and returns a function applying them,
+    for masks that are reused across several images.
+    """
+    operations = [
+        (MASK_OPERATIONS[k], v) for k, v in kwargs.items() if k in MASK_OPERATIONS
+    ]
+
+    def mask_function(im, mask_im):
+        mask = None
+        for operation, v in operations:
+            mask = operation(mask_im, v)
+
+        if mask is not None:
+            return im.updateMask(mask)
+
+    return mask_function
+
+
+def make_eq_mask(v):
+    """
+    Returns a function masking im where mask_im equals v.
+    """
+    return lambda im, mask_im: im.updateMask(mask_im.eq(v))
+
+
 def simple_mask_function(im, mask_im, **kwargs):
     """
     Applies a simple mask onto im with a single QA value from mask_im.
     """
-    mask = None
-
-    for k, v in kwargs.items():
-        if str(k) == "gt":
-            mask = mask_im.gt(v)
-        elif str(k) == "gte":
-            mask = mask_im.gte(v)
-        elif str(k) == "lt":
-            mask = mask_im.lt(v)
-        elif str(k) == "lte":
-            mask = mask_im.lte(v)
-        elif str(k) == "eq":
-            mask = mask_im.eq(v)
-        elif str(k) == "eq_or":
-            v = list(v)
-            mask = mask_im.eq(v[0]).Or(mask_im.eq(v[1]))
-        elif str(k) == "range":
-            v = list(v)
-            mask = mask_im.gte(v[0]).And(mask_im.lt(v[1]))
-
-    if mask is not None:
-        return im.updateMask(mask)
+    return make_mask_function(**kwargs)(im, mask_im)
 
 
 def filter_fires(im):
@@ -22,6 +22,11 @@ import logging
 
 def get_logger(module_name):
     logger = logging.getLogger(module_name)
+
+    # configure each named logger once, repeated calls reuse the existing handler
+    if logger.handlers:
+        return logger
+
     logger.setLevel(logging.DEBUG)
 
     handler = logging.StreamHandler()
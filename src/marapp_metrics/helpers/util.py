@@ -26,6 +26,28 @@ class DataReadException(Exception):
     pass
 
 
+try:
+    from functools import cached_property
+except ImportError:  # Python < 3.8
+
+    class cached_property:
+        """Computes the attribute once per instance, then stores it on the instance."""
+
+        def __init__(self, func):
+            self.func = func
+            self.attrname = func.__name__
+            self.__doc__ = func.__doc__
+
+        def __set_name__(self, owner, name):
+            self.attrname = name
+
+        def __get__(self, instance, owner=None):
+            if instance is None:
+                return self
+            value = instance.__dict__[self.attrname] = self.func(instance)
+            return value
+
+
 @contextmanager
 def file_reader(filename):
     relative_filename = path.join("..", path.dirname(__file__), filename)
@@ -17,19 +17,37 @@
   specific language governing permissions and limitations under the License.
 """
 
+import hashlib
+
 import ee
-import geojson
 import geopandas as gpd
-import pandas as pd
-from collections.abc import Iterable
-from shapely import wkt
-
-from ...helpers.config import Config
-from ...helpers.earthengine import map_function, initialize_google_ee
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from pyproj import Transformer
+from shapely.ops import transform
+
+from ...helpers.config import get_config
+from ...helpers.earthengine import (
+    fuse_reducers,
+    initialize_google_ee,
+    map_function,
+)
 from ...helpers.logging import get_logger
 
 logger = get_logger("base-metric")
 
+# reused across calls instead of building a transformer per to_crs()
+MERCATOR_TRANSFORMER = Transformer.from_crs("EPSG:4326", "EPSG:3395", always_xy=True)
+
+
+def round_coordinates(x, y, z=None, decimals=4):
+    """Rounds coordinate arrays, 4 decimals gives nearest 10m."""
+
+    if z is None:
+        return np.round(x, decimals), np.round(y, decimals)
+    return np.round(x, decimals), np.round(y, decimals), np.round(z, decimals)
+
 
 class MetricPackageException(Exception):
     pass
@@ -51,7 +69,10 @@ class MetricBase:
         :keyword area_threshold: Size at which polygons are broken into grids
         :keyword grid_size_degrees: Grid size in arc degrees
         :keyword chunk_size: Analyse in blocks
+        :keyword chunk_parallelism: Number of blocks analysed concurrently
+        :keyword chunk_timeout: Max seconds to wait for all blocks, single block included
         :keyword config_filepath: Yaml config file
+        :keyword cache: Dict-like store for intersect results, shared across calls
         """
         # Initialize Earth Engine, using the authentication credentials.
         initialize_google_ee()
@@ -66,7 +87,10 @@ class MetricBase:
         self._best_effort = kwargs.get("best_effort", False)
         self.max_pixels = kwargs.get("max_pixels", 1e18)
         self.chunk_size = kwargs.get("chunk_size", 500)
+        self.chunk_parallelism = kwargs.get("chunk_parallelism", 4)
+        self.chunk_timeout = kwargs.get("chunk_timeout", None)
         self.use_exceeds_limit = kwargs.get("use_exceeds_limit", False)
+        self.cache = kwargs.get("cache", None)
 
         if self.simplify:
             self.simplify_tolerance = 0.001
@@ -76,7 +100,7 @@ class MetricBase:
             self.max_pixels = 1e7
 
         filepath = kwargs.get("config_filepath", "earthengine.yaml")
-        self._config = Config(filepath)
+        self._config = get_config(filepath)
 
     def measure(self, gdf, area_km2=None):
         """
@@ -111,38 +135,99 @@ class MetricBase:
         return False
 
     def _intersect(self, feats_list, reducers, scale):
+        # one result per feature, fill in place instead of growing the list
+        data = [None] * len(feats_list)
+        offset = 0
+        for chunk_data in self._intersect_chunks(feats_list, reducers, scale):
+            data[offset : offset + len(chunk_data)] = chunk_data
+            offset += len(chunk_data)
+
+        del data[offset:]
+        return data
+
+    def _intersect_iter(self, feats_list, reducers, scale):
+        """
+        Yields the properties of each feature as its chunk completes, so a single
+        pass aggregation runs while the remaining chunks are still in flight.
+        """
+        for chunk_data in self._intersect_chunks(feats_list, reducers, scale):
+            yield from chunk_data
+
+    def _intersect_chunks(self, feats_list, reducers, scale):
+        """
+        Splits features into chunks and yields each chunk's properties, in order.
+        """
+        if not feats_list:
+            return
+
+        # reducers sharing the same ee.Reducer run in a single reduceRegion
+        groups = fuse_reducers(reducers)
+
         n = self.chunk_size
+        if len(feats_list) <= n and self.chunk_timeout is None:
+            # single chunk, no need for slicing or a thread pool
+            logger.info("Analysing chunk 1 of 1")
+            yield self._process_chunk(ee.FeatureCollection(feats_list), groups, scale)
+            return
+
         chunked_feat_cols = [
             ee.FeatureCollection(feats_list[i : i + n])
             for i in range(0, len(feats_list), n)
         ]
+        total = len(chunked_feat_cols)
+
+        def process_chunk(args):
+            i, feats = args
+            logger.info(f"Analysing chunk {i+1} of {total}")
+            return self._process_chunk(feats, groups, scale)
+
+        # chunks are independent getInfo() round-trips, overlap the network waits;
+        # not a with-block, its exit would wait on in-flight getInfo() after a timeout
+        executor = ThreadPoolExecutor(max_workers=self.chunk_parallelism)
+        try:
+            results = executor.map(
+                process_chunk, enumerate(chunked_feat_cols), timeout=self.chunk_timeout
+            )
+            yield from results
+        except FutureTimeoutError:
+            raise MetricComputeException(
+                f"Could not compute metric for geometry. Exceeded {self.chunk_timeout}s"
+            )
+        finally:
+            # pending chunks are cancelled by map(), running ones finish detached
+            executor.shutdown(wait=False)
 
-        data = []
-        for i, feats in enumerate(chunked_feat_cols):
-            logger.info(f"Analysing chunk {i+1} of {len(chunked_feat_cols)}")
-            for k, v in reducers.items():
-                im = v["image"]
-                reducer = v["reducer"]
-                band = v.get("band", False)
-                if band:
-                    band = k
-
-                feats = feats.map(
-                    map_function(
-                        image=im,
-                        scale=scale,
-                        reducers={k: reducer},
-                        keep_geom=True,
-                        band=band,
-                        best_effort=self._best_effort,
-                        max_pixels=self.max_pixels,
-                    )
-                )
+    def _process_chunk(self, feats, groups, scale):
+        """
+        Reduces a chunk of features server-side and returns their properties.
+        :param feats: ee.FeatureCollection
+        :param groups: fused reducer groups
+        :param scale: pixel scale (m)
+        :return: list of property dicts
+        """
+        # Drop unnecessary geom after intersect, in the same map
+        feats_no_geom = feats.map(
+            map_function(
+                groups=groups,
+                scale=scale,
+                keep_geom=False,
+                best_effort=self._best_effort,
+                max_pixels=self.max_pixels,
+            )
+        )
+
+        # the serialized graph holds geometries, images, reducers and compute flags
+        cache_key = None
+        if self.cache is not None:
+            graph = feats_no_geom.serialize().encode("utf-8")
+            cache_key = f"{self.slug}:{hashlib.sha1(graph).hexdigest()}"
+            if cache_key in self.cache:
+                return self.cache[cache_key]
 
-            # Drop unnecessary geom after intersect
-            feats_no_geom = feats.map(lambda e: e.setGeometry(None))
-            data += [f["properties"] for f in feats_no_geom.getInfo()["features"]]
+        data = [f["properties"] for f in feats_no_geom.getInfo()["features"]]
 
+        if cache_key is not None:
+            self.cache[cache_key] = data
         return data
 
     def _simplify_polygon(self, gdf):
@@ -155,10 +240,10 @@ class MetricBase:
             tolerance=self.simplify_tolerance, preserve_topology=True
         ).buffer(0)
 
-        for i in range(0, len(simple_gdf)):
-            geom = simple_gdf.iloc[i].geometry
-            g = wkt.dumps(geom, rounding_precision=4)
-            simple_gdf.at[i, "geometry"] = wkt.loads(g)
+        # round coordinates on the coordinate arrays, no WKT round-trip
+        simple_gdf["geometry"] = simple_gdf.geometry.apply(
+            lambda geom: transform(round_coordinates, geom)
+        )
 
         return simple_gdf
 
@@ -169,24 +254,11 @@ class MetricBase:
         :param param gdf: GeoDataFrame
         :return: featureCollection
         """
-        new_gdf = gpd.GeoDataFrame()
+        polygons = gdf.geometry.explode().reset_index(drop=True)
 
-        for i in range(0, len(gdf)):
-            row = gdf.iloc[i]
-
-            if isinstance(row.geometry, Iterable):
-                polygons = list(row.geometry)
-            else:
-                polygons = [row.geometry]
-
-            for poly in polygons:
-                tmp_gdf = gpd.GeoDataFrame({"geometry": [poly]}, geometry="geometry")
-                new_gdf = gpd.GeoDataFrame(
-                    pd.concat([new_gdf, tmp_gdf], ignore_index=True)
-                )
-
-        new_gdf.crs = "EPSG:4326"
-        polys_gdf = new_gdf.copy()
+        polys_gdf = gpd.GeoDataFrame(
+            {"geometry": polygons}, geometry="geometry", crs="EPSG:4326"
+        )
 
         # Simplify so shapes are small enough to meet GEE's payload size.
         # Tolerance = 0.00001 is very close to original quality
@@ -195,18 +267,27 @@ class MetricBase:
             polys_gdf = self._simplify_polygon(polys_gdf)
 
         # to equal area for area measurement
-        equal_area_gdf = polys_gdf.to_crs("EPSG:3395")
-
-        polys_gdf["area_km2"] = equal_area_gdf["geometry"].area / 10 ** 6
-        geom = geojson.loads(polys_gdf.to_json())
+        polys_gdf["area_km2"] = (
+            np.fromiter(
+                (
+                    transform(MERCATOR_TRANSFORMER.transform, geom).area
+                    for geom in polys_gdf.geometry
+                ),
+                dtype=np.float64,
+                count=len(polys_gdf),
+            )
+            / 10 ** 6
+        )
 
         if self.grid:
             feats = [
                 {
-                    "ee_feature": ee.Feature(geom=f["geometry"], opt_properties={}),
-                    "area_km2": f["properties"].get("area_km2"),
+                    "ee_feature": ee.Feature(
+                        geom=ee.Geometry(geom.__geo_interface__), opt_properties={}
+                    ),
+                    "area_km2": area_km2,
                 }
-                for f in geom["features"]
+                for geom, area_km2 in zip(polys_gdf.geometry, polys_gdf["area_km2"])
             ]
 
             # Grid large shapes
@@ -226,8 +307,8 @@ class MetricBase:
             return gridded_feature_list
         else:
             return [
-                ee.Feature(geom=f["geometry"], opt_properties={})
-                for f in geom["features"]
+                ee.Feature(geom=ee.Geometry(geom.__geo_interface__), opt_properties={})
+                for geom in polys_gdf.geometry
             ]
 
     def _create_grid(self, ee_feature, grid_size_degrees):
@@ -241,15 +322,11 @@ class MetricBase:
         # Arc grid JS equivalent here https://code.earthengine.google.com/bdb4f409515d1fda0592a8330a0f6528
 
         # Get bounds of grid
-        bounds = ee_feature.bounds().geometry().bounds().getInfo()
+        # ring of the axis-aligned box: [[xmin, ymin], [xmax, ymin], [xmax, ymax], ...]
+        ring = ee_feature.geometry().bounds().coordinates().get(0).getInfo()
 
-        x_coords = [b[0] for b in bounds["coordinates"][0]]
-        y_coords = [b[1] for b in bounds["coordinates"][0]]
-
-        lon_start = min(x_coords)
-        lon_end = max(x_coords)
-        lat_start = min(y_coords)
-        lat_end = max(y_coords)
+        lon_start, lat_start = ring[0]
+        lon_end, lat_end = ring[2]
 
         lon_width = lon_end - lon_start
         lat_width = lat_end - lat_start
@@ -264,21 +341,15 @@ class MetricBase:
                 "Expecting less than 4 grids. Consider using a smaller grid_size_degrees or larger area_threshold."
             )
 
-        # Generate grid over ee_feature
-        polys = []
-        lon = lon_start
-        while lon < lon_end:
-            x1 = lon
-            x2 = lon + grid_size_degrees
-            lon += grid_size_degrees
-
-            lat = lat_start
-            while lat < lat_end:
-                y1 = lat
-                y2 = lat + grid_size_degrees
-                lat += grid_size_degrees
+        # Generate grid over ee_feature, cells ordered by longitude then latitude
+        lons = np.arange(lon_start, lon_end, grid_size_degrees)
+        lats = np.arange(lat_start, lat_end, grid_size_degrees)
+        x1, y1 = (a.ravel() for a in np.meshgrid(lons, lats, indexing="ij"))
+        cells = np.column_stack(
+            [x1, y1, x1 + grid_size_degrees, y1 + grid_size_degrees]
+        ).tolist()
 
-                polys.append(ee.Feature(ee.Geometry.Rectangle(x1, y1, x2, y2), {}))
+        polys = [ee.Feature(ee.Geometry.Rectangle(*cell), {}) for cell in cells]
 
         # Intersects grid against ee_feature
         intersected_feats = []
@@ -291,3 +362,61 @@ class MetricBase:
             )
 
         return intersected_feats
+
+
+def measure_batch(metrics, gdf, area_km2=None):
+    """
+    Computes several metrics over the same GeoDataFrame, sharing the shape breakdown
+    and issuing a single intersect per group of metrics with matching compute flags.
+    Shape flags (grid, simplify, ...) are taken from the first metric, chunk settings
+    (chunk_size, chunk_parallelism, chunk_timeout) and cache from the first metric of
+    each group.
+    :param metrics: list of MetricBase objects
+    :param gdf: GeoDataFrame
+    :param area_km2:
+    :return: list of Metric objects, in the same order as metrics
+    """
+    if not metrics:
+        return []
+
+    for metric in metrics:
+        if metric._exceeds_limit(area_km2):
+            raise MetricComputeException(
+                f"Could not compute metric for geometry. Area exceeds limit: {area_km2}km2"
+            )
+
+    feats = metrics[0]._breakdown_shape(gdf)
+
+    groups = {}
+    for i, metric in enumerate(metrics):
+        key = (metric._scale, metric._best_effort, metric.max_pixels)
+        groups.setdefault(key, []).append((i, metric))
+
+    results = [None] * len(metrics)
+    for group in groups.values():
+        # prefix reducer keys per metric to keep them apart
+        reducers = {}
+        for i, metric in group:
+            for k, v in metric._reducers.items():
+                prefixed_key = f"{metric.slug}_{i}__{k}"
+                if v.get("band", False):
+                    v = dict(v, image=v["image"].select([k]).rename([prefixed_key]))
+                reducers[prefixed_key] = v
+
+        _, first = group[0]
+        ee_data = first._intersect(feats, reducers, first._scale)
+
+        for i, metric in group:
+            prefix = f"{metric.slug}_{i}__"
+            metric_data = [
+                {
+                    k[len(prefix) :]: v
+                    for k, v in properties.items()
+                    if k.startswith(prefix)
+                }
+                for properties in ee_data
+            ]
+            raw_data = metric._aggregate(metric_data)
+            results[i] = metric._package_metric(raw_data)
+
+    return results
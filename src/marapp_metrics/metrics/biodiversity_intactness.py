@@ -21,8 +21,9 @@ import collections
 
 import ee
 
-from ..helpers.util import abspath
+from ..helpers.util import abspath, cached_property
 from .base.metric_base import MetricBase, MetricPackageException
+from ..helpers.earthengine import get_area_km2_image, get_sum_reducer
 from ..helpers.logging import get_logger
 
 logger = get_logger("biodiversity-intactness")
@@ -43,6 +44,9 @@ metric_fields = {
     "percentile_90": 0,
 }
 
+# decile bin keys of the BII histogram: "0.0".."0.9"
+BIN_KEYS = [f"{i / 10:.1f}" for i in range(10)]
+
 Metric = collections.namedtuple(
     "Metric", metric_fields.keys(), defaults=metric_fields.values()
 )
@@ -80,51 +84,46 @@ class BiodiversityIntactnessMetric(MetricBase):
             "metrics.biodiversity_intactness.dataset"
         )
 
-        # initialize ee.Image
-        self._ee_im = ee.Image(self._ee_dataset).rename(["bii"])
-        self._ee_im_mean = (
-            self._ee_im.multiply(ee.Image.pixelArea())
-            .divide(1e6)
-            .rename("area_product")
-        )
-        self._ee_im_area = ee.Image.pixelArea().divide(1e6).rename("area")  # km2
-        self._ee_im_bii_area = (
-            self._ee_im.gte(0)
-            .multiply(ee.Image.pixelArea())
-            .divide(1e6)
-            .rename("bii_area")
-        )  # km2
-
-    def measure(self, gdf, area_km2=None):
-        super().measure(gdf, area_km2)
-
-        feats = self._breakdown_shape(gdf)
+    @cached_property
+    def _reducers(self):
+        """
+        Reducer dict - keys match bands in raster.
+        """
+        ee_im = ee.Image(self._ee_dataset).rename(["bii"])
+        ee_im_area = get_area_km2_image()  # km2
+        ee_im_mean = ee_im.multiply(ee_im_area).rename("area_product")
+        ee_im_bii_area = ee_im.gte(0).multiply(ee_im_area).rename("bii_area")  # km2
 
-        reducers = {
+        return {
             "bii": {
                 "reducer": ee.Reducer.fixedHistogram(0.0, 1.0, 10).unweighted(),
-                "image": self._ee_im,
+                "image": ee_im,
                 "band": True,
             },
             "bii_area": {
-                "reducer": ee.Reducer.sum().unweighted(),
-                "image": self._ee_im_bii_area,
+                "reducer": get_sum_reducer(),
+                "image": ee_im_bii_area,
                 "band": True,
             },
             "area": {
-                "reducer": ee.Reducer.sum().unweighted(),
-                "image": self._ee_im_area,
+                "reducer": get_sum_reducer(),
+                "image": ee_im_area,
                 "band": True,
             },
             "area_product": {
-                "reducer": ee.Reducer.sum().unweighted(),
-                "image": self._ee_im_mean,
+                "reducer": get_sum_reducer(),
+                "image": ee_im_mean,
                 "band": True,
             },
         }
 
+    def measure(self, gdf, area_km2=None):
+        super().measure(gdf, area_km2)
+
+        feats = self._breakdown_shape(gdf)
+
         # ee compute area
-        ee_data = self._intersect(feats, reducers, self._scale)
+        ee_data = self._intersect_iter(feats, self._reducers, self._scale)
 
         # aggregate data
         raw_data = self._aggregate(ee_data)
@@ -137,28 +136,19 @@ class BiodiversityIntactnessMetric(MetricBase):
         :param data: JSON object
         :return: Metric object
         """
-        area = sum([d["area"] for d in data])
-        intactness = sum([d["bii_area"] for d in data])
-        area_product = sum([d["area_product"] for d in data])
-        mean = area_product / area
-        tmp_hist = {
-            "0.0": 0,
-            "0.1": 0,
-            "0.2": 0,
-            "0.3": 0,
-            "0.4": 0,
-            "0.5": 0,
-            "0.6": 0,
-            "0.7": 0,
-            "0.8": 0,
-            "0.9": 0,
-        }
+        area = 0
+        intactness = 0
+        area_product = 0
+        tmp_hist = dict.fromkeys(BIN_KEYS, 0)
         for d in data:
+            area += d["area"]
+            intactness += d["bii_area"]
+            area_product += d["area_product"]
             bii_hist = d.get("bii", None)
             if bii_hist:
                 for el in bii_hist:
-                    perc_bin = str(float(round(el[0], 2)))
-                    tmp_hist[perc_bin] += el[1]
+                    tmp_hist[BIN_KEYS[int(round(el[0] * 10))]] += el[1]
+        mean = area_product / area
         return {"area": area, "intactness": intactness, "mean": mean, "bii": tmp_hist}
 
     def _package_metric(self, raw_data):
@@ -18,11 +18,16 @@
 """
 
 import collections
+import functools
 import ee
 
-from ..helpers.util import abspath
+from ..helpers.util import abspath, cached_property
 from .base.metric_base import MetricBase, MetricPackageException
-from ..helpers.earthengine import simple_mask_function
+from ..helpers.earthengine import (
+    get_area_km2_image,
+    get_sum_reducer,
+    make_mask_function,
+)
 from ..helpers.logging import get_logger
 
 logger = get_logger("human-footprint")
@@ -41,6 +46,31 @@ Metric = collections.namedtuple(
 )
 
 
+@functools.lru_cache(maxsize=None)
+def _build_ee_images(dataset_items):
+    """
+    Stacks the area weighted footprint of both survey years with their pixel bands.
+    :param dataset_items: tuple of (year, asset id) pairs
+    :return: ee.Image with 1993, 2009, area, px_1993 and px_2009 bands
+    """
+    dataset = dict(dataset_items)
+
+    ee_im_area = get_area_km2_image()  # km2
+
+    _ee_im_1993_area = ee.Image(dataset.get("1993")).multiply(ee_im_area)
+    _ee_im_2009_area = ee.Image(dataset.get("2009")).multiply(ee_im_area)
+    ee_im = ee.Image.cat([_ee_im_1993_area, _ee_im_2009_area, ee_im_area])
+    ee_im = ee_im.rename(["1993", "2009", "area"])
+
+    mask_gte0 = make_mask_function(gte=0)
+    _ee_im_1993_px = mask_gte0(_ee_im_1993_area, _ee_im_1993_area)
+    _ee_im_2009_px = mask_gte0(_ee_im_2009_area, _ee_im_2009_area)
+    ee_px = ee.Image.cat([_ee_im_1993_px, _ee_im_2009_px])
+    ee_px = ee_px.rename(["px_1993", "px_2009"])
+
+    return ee_im.addBands(ee_px)
+
+
 class HumanFootprint(MetricBase):
     """
     Calculates human footprint over two time ranges: 1993, 2009.
@@ -70,27 +100,19 @@ class HumanFootprint(MetricBase):
         # config
         self._ee_dataset = self._config.get_property("metrics.human_footprint.dataset")
 
-        # initialize ee.Images to be used for zonal statistics later
-        area_im = ee.Image.pixelArea()  # area raster
-        self._ee_im_area = area_im.divide(1e6).rename(["area"])  # km2
-
-        _ee_im_1993_area = ee.Image(self._ee_dataset.get("1993")).multiply(
-            self._ee_im_area
-        )
-        _ee_im_2009_area = ee.Image(self._ee_dataset.get("2009")).multiply(
-            self._ee_im_area
-        )
-        _ee_im_col_area = ee.ImageCollection(
-            [_ee_im_1993_area, _ee_im_2009_area, self._ee_im_area]
-        )
-        _ee_im = _ee_im_col_area.toBands()
-        self._ee_im = _ee_im.rename(["1993", "2009", "area"])
-
-        _ee_im_1993_px = simple_mask_function(_ee_im_1993_area, _ee_im_1993_area, gte=0)
-        _ee_im_2009_px = simple_mask_function(_ee_im_2009_area, _ee_im_2009_area, gte=0)
-        _ee_im_col_px = ee.ImageCollection([_ee_im_1993_px, _ee_im_2009_px])
-        _ee_px = _ee_im_col_px.toBands()
-        self._ee_px = _ee_px.rename(["1993", "2009"])
+    @cached_property
+    def _reducers(self):
+        """
+        Single sum over the footprint, area and pixel bands.
+        """
+        ee_im = _build_ee_images(tuple(self._ee_dataset.items()))
+        return {
+            "human_footprint": {
+                "reducer": get_sum_reducer(),
+                "image": ee_im,
+                "band": False,  # key is not a band name
+            }
+        }
 
     def measure(self, gdf, area_km2=None):
         super().measure(gdf, area_km2)
@@ -99,22 +121,8 @@ class HumanFootprint(MetricBase):
             gdf
         )  # creates a featCol from target geom (i.e. multi-poly --> polygons)
 
-        # reducer dict - keys match bands in raster
-        reducers = {
-            "human_footprint_area": {
-                "reducer": ee.Reducer.sum().unweighted(),
-                "image": self._ee_im,
-                "band": False,  # key is not a band name
-            },
-            "human_footprint_px": {
-                "reducer": ee.Reducer.sum().unweighted(),
-                "image": self._ee_px,
-                "band": False,  # key is not a band name
-            },
-        }
-
         # ee compute area
-        ee_data = self._intersect(feats, reducers, self._scale)
+        ee_data = self._intersect_iter(feats, self._reducers, self._scale)
 
         # aggregate data
         raw_data = self._aggregate(ee_data)
@@ -127,11 +135,18 @@ class HumanFootprint(MetricBase):
         :param data: JSON object
         :return: Metric object
         """
-        area = sum([d["human_footprint_area"]["area"] for d in data])
-        metric_area_93 = sum([d["human_footprint_area"]["1993"] for d in data])
-        metric_area_09 = sum([d["human_footprint_area"]["2009"] for d in data])
-        metric_px_93 = sum([d["human_footprint_px"]["1993"] for d in data])
-        metric_px_09 = sum([d["human_footprint_px"]["2009"] for d in data])
+        area = 0
+        metric_area_93 = 0
+        metric_area_09 = 0
+        metric_px_93 = 0
+        metric_px_09 = 0
+        for d in data:
+            footprint = d["human_footprint"]
+            area += footprint["area"]
+            metric_area_93 += footprint["1993"]
+            metric_area_09 += footprint["2009"]
+            metric_px_93 += footprint["px_1993"]
+            metric_px_09 += footprint["px_2009"]
 
         return {
             "area": area,
@@ -18,11 +18,12 @@
 """
 
 import collections
+import functools
 import ee
 
-from ..helpers.util import abspath
+from ..helpers.util import abspath, cached_property
 from .base.metric_base import MetricBase, MetricPackageException
-from ..helpers.earthengine import simple_mask_function
+from ..helpers.earthengine import get_area_km2_image, get_sum_reducer, make_eq_mask
 from ..helpers.logging import get_logger
 
 logger = get_logger("human-impact")
@@ -50,6 +51,28 @@ Metric = collections.namedtuple(
 )
 
 
+@functools.lru_cache(maxsize=None)
+def _build_ee_images(dataset):
+    """
+    Splits the pixel area by human influence category, one band per category.
+    :param dataset: asset id
+    :return: ee.Image with area_no_data, area_0 to area_4 and area bands
+    """
+    ee_im = ee.Image(dataset).rename(["li"])  # converting asset into an image
+    ee_im_area = get_area_km2_image()  # km2
+
+    # mask each category to get area, one band per category
+    _ee_im_dict = {"area_no_data": make_eq_mask(-1)(ee_im_area, ee_im)}
+    for j in range(0, 5):
+        _ee_im_dict[f"area_{j}"] = make_eq_mask(j)(ee_im_area, ee_im)
+    _ee_im_dict["area"] = ee_im_area
+
+    ee_im_area_by_class = ee.Image.cat(list(_ee_im_dict.values()))
+    ee_im_area_by_class = ee_im_area_by_class.rename(list(_ee_im_dict.keys()))
+
+    return ee_im_area_by_class
+
+
 class HumanInfluenceEnsembleMetric(MetricBase):
     """
     Human impact index.
@@ -81,33 +104,19 @@ class HumanInfluenceEnsembleMetric(MetricBase):
             "metrics.human_impact.dataset"
         )  # only requires low impact
 
-        # initialize ee.Images to be used for zonal statistics later
-        area_im = ee.Image.pixelArea()  # area raster
-        self._ee_im = ee.Image(self._ee_dataset).rename(
-            ["li"]
-        )  # converting asset into an image
-        self._ee_im_area = area_im.divide(1e6).rename(["area"])  # km2
-
-        # mask each category to get area
-        # collapse into Image collection?
-        self._ee_im_area_no_data = simple_mask_function(
-            self._ee_im_area, self._ee_im, eq=-1
-        ).rename(["area_no_data"])
-        self._ee_im_area_0 = simple_mask_function(
-            self._ee_im_area, self._ee_im, eq=0
-        ).rename(["area_0"])
-        self._ee_im_area_1 = simple_mask_function(
-            self._ee_im_area, self._ee_im, eq=1
-        ).rename(["area_1"])
-        self._ee_im_area_2 = simple_mask_function(
-            self._ee_im_area, self._ee_im, eq=2
-        ).rename(["area_2"])
-        self._ee_im_area_3 = simple_mask_function(
-            self._ee_im_area, self._ee_im, eq=3
-        ).rename(["area_3"])
-        self._ee_im_area_4 = simple_mask_function(
-            self._ee_im_area, self._ee_im, eq=4
-        ).rename(["area_4"])
+    @cached_property
+    def _reducers(self):
+        """
+        Single sum over the per category area bands.
+        """
+        ee_im_area_by_class = _build_ee_images(self._ee_dataset)
+        return {
+            "area_by_class": {
+                "reducer": get_sum_reducer(),
+                "image": ee_im_area_by_class,
+                "band": False,  # key is not a band name
+            }
+        }
 
     def measure(self, gdf, area_km2=None):
         super().measure(gdf, area_km2)
@@ -116,47 +125,8 @@ class HumanInfluenceEnsembleMetric(MetricBase):
             gdf
         )  # creates a featCol from target geom (i.e. multi-poly --> polygons)
 
-        # reducer dict - keys match bands in raster
-        reducers = {
-            "area_no_data": {
-                "reducer": ee.Reducer.sum().unweighted(),
-                "image": self._ee_im_area_no_data,
-                "band": True,
-            },
-            "area_0": {
-                "reducer": ee.Reducer.sum().unweighted(),
-                "image": self._ee_im_area_0,
-                "band": True,
-            },
-            "area_1": {
-                "reducer": ee.Reducer.sum().unweighted(),
-                "image": self._ee_im_area_1,
-                "band": True,
-            },
-            "area_2": {
-                "reducer": ee.Reducer.sum().unweighted(),
-                "image": self._ee_im_area_2,
-                "band": True,
-            },
-            "area_3": {
-                "reducer": ee.Reducer.sum().unweighted(),
-                "image": self._ee_im_area_3,
-                "band": True,
-            },
-            "area_4": {
-                "reducer": ee.Reducer.sum().unweighted(),
-                "image": self._ee_im_area_4,
-                "band": True,
-            },
-            "area": {
-                "reducer": ee.Reducer.sum().unweighted(),
-                "image": self._ee_im_area,
-                "band": True,
-            },
-        }
-
         # ee compute area
-        ee_data = self._intersect(feats, reducers, self._scale)
+        ee_data = self._intersect_iter(feats, self._reducers, self._scale)
 
         # aggregate data
         raw_data = self._aggregate(ee_data)
@@ -169,13 +139,22 @@ class HumanInfluenceEnsembleMetric(MetricBase):
         :param data: JSON object
         :return: Metric object
         """
-        area = sum([d["area"] for d in data])
-        metric_area_no_data = sum([d["area_no_data"] for d in data])
-        metric_area_0 = sum([d["area_0"] for d in data])
-        metric_area_1 = sum([d["area_1"] for d in data])
-        metric_area_2 = sum([d["area_2"] for d in data])
-        metric_area_3 = sum([d["area_3"] for d in data])
-        metric_area_4 = sum([d["area_4"] for d in data])
+        area = 0
+        metric_area_no_data = 0
+        metric_area_0 = 0
+        metric_area_1 = 0
+        metric_area_2 = 0
+        metric_area_3 = 0
+        metric_area_4 = 0
+        for d in data:
+            area_by_class = d["area_by_class"]
+            area += area_by_class["area"]
+            metric_area_no_data += area_by_class["area_no_data"]
+            metric_area_0 += area_by_class["area_0"]
+            metric_area_1 += area_by_class["area_1"]
+            metric_area_2 += area_by_class["area_2"]
+            metric_area_3 += area_by_class["area_3"]
+            metric_area_4 += area_by_class["area_4"]
         metric_area_masked = (
             area
             - metric_area_no_data
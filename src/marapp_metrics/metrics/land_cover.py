@@ -18,12 +18,14 @@
 """
 
 import collections
+import functools
 import ee
+import numpy as np
 
 from .base.metric_base import MetricBase, MetricPackageException
-from ..helpers.earthengine import simple_mask_function
+from ..helpers.earthengine import get_area_km2_image, get_sum_reducer
 from ..helpers.logging import get_logger
-from ..helpers.util import abspath, json_reader
+from ..helpers.util import abspath, cached_property, json_reader
 
 logger = get_logger("land-cover")
 
@@ -34,6 +36,26 @@ Metric = collections.namedtuple(
 )
 
 
+@functools.lru_cache(maxsize=None)
+def _build_ee_images(dataset, class_keys):
+    """
+    Splits the pixel area by land cover class, one band per taxonomy class.
+    :param dataset: asset id
+    :param class_keys: tuple of taxonomy class codes
+    :return: ee.Image with one area band per class code
+    """
+    ee_im_area = get_area_km2_image()  # km2
+    ee_im_lulc = ee.Image(dataset)
+
+    # one-hot encode every class in a single eq against a multi-band constant
+    class_codes = [int(key) for key in class_keys]
+    _ee_im_onehot = ee_im_lulc.eq(ee.Image.constant(class_codes))
+    _ee_im_onehot = _ee_im_onehot.rename(list(class_keys))
+    ee_im = _ee_im_onehot.multiply(ee_im_area)
+
+    return ee_im
+
+
 class LandUseLandCover(MetricBase):
     """
     Calculates area of land use / land cover classification for 2015.
@@ -64,22 +86,37 @@ class LandUseLandCover(MetricBase):
         self._ee_dataset = self._config.get_property("metrics.land_use.dataset")
         self._dataset_defs = json_reader("../data/land_cover_defs.json")
 
-        # initialize ee.Images to be used for zonal statistics later
-        area_im = ee.Image.pixelArea()  # area raster
-        self._ee_im_area = area_im.divide(1e6).rename(["area"])  # km2
-        self._ee_im_lulc = ee.Image(self._ee_dataset)
-
-        im_dict = {}
-        taxonomy = self._dataset_defs["taxonomy"]
-        for key in taxonomy.keys():
-            tmp_im = simple_mask_function(
-                self._ee_im_area, self._ee_im_lulc, eq=int(key)
+        # bands ordered by class group, so groups are contiguous slices
+        class_defs = self._dataset_defs["class_defs"]
+        self._group_slugs = [class_def["slug"] for class_def in class_defs]
+        self._band_idx = {
+            str(key): i
+            for i, key in enumerate(
+                key for class_def in class_defs for key in class_def["classes"]
             )
-            im_dict[key] = tmp_im
-
-        _ee_im_col_area = ee.ImageCollection(list(im_dict.values()))
-        _ee_im = _ee_im_col_area.toBands()
-        self._ee_im = _ee_im.rename(list(im_dict.keys()))
+        }
+        # explicit slices, so an empty group sums to 0 (reduceat would not)
+        group_ends = np.cumsum([len(class_def["classes"]) for class_def in class_defs])
+        self._group_slices = [
+            slice(end - len(class_def["classes"]), end)
+            for class_def, end in zip(class_defs, group_ends)
+        ]
+
+    @cached_property
+    def _reducers(self):
+        """
+        Single sum over the per class area bands.
+        """
+        ee_im = _build_ee_images(
+            self._ee_dataset, tuple(self._dataset_defs["taxonomy"].keys())
+        )
+        return {
+            "land_cover_2015": {
+                "reducer": get_sum_reducer(),
+                "image": ee_im,
+                "band": False,  # key is not a band name
+            }
+        }
 
     def measure(self, gdf, area_km2=None):
         super().measure(gdf, area_km2)
@@ -88,17 +125,8 @@ class LandUseLandCover(MetricBase):
             gdf
         )  # creates a featCol from target geom (i.e. multi-poly --> polygons)
 
-        # reducer dict - keys match bands in raster
-        reducers = {
-            "land_cover_2015": {
-                "reducer": ee.Reducer.sum().unweighted(),
-                "image": self._ee_im,
-                "band": False,  # key is not a band name
-            }
-        }
-
         # ee compute area
-        ee_data = self._intersect(feats, reducers, self._scale)
+        ee_data = self._intersect_iter(feats, self._reducers, self._scale)
 
         # aggregate data
         raw_data = self._aggregate(ee_data)
@@ -111,26 +139,18 @@ class LandUseLandCover(MetricBase):
         :param data: JSON object
         :return: Metric object
         """
-        # get tmp aggregation dict
-        class_defs = self._dataset_defs["class_defs"]
+        band_areas = np.zeros(len(self._band_idx))
+        for d in data:
+            for k, v in d["land_cover_2015"].items():
+                band_idx = self._band_idx.get(k)
+                if band_idx is not None:
+                    band_areas[band_idx] += v
 
-        total_data_area = 0
-        for class_def in class_defs:
-            area_sum = 0
-            for d in data:
-                area_sum += sum(
-                    [
-                        v
-                        for k, v in d["land_cover_2015"].items()
-                        if k in class_def["classes"]
-                    ]
-                )
-            total_data_area += area_sum
-            class_def["area"] = area_sum
+        group_areas = [float(band_areas[s].sum()) for s in self._group_slices]
 
         return {
-            "data_2015": {el["slug"]: el["area"] for el in class_defs},
-            "area": total_data_area,
+            "data_2015": dict(zip(self._group_slugs, group_areas)),
+            "area": float(band_areas.sum()),
         }
 
     def _package_metric(self, raw_data):
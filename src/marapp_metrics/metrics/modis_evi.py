@@ -18,15 +18,16 @@
 """
 
 import collections
+import functools
 
 import ee
 import numpy as np
 
 
 from .base.metric_base import MetricBase, MetricPackageException
-from ..helpers.earthengine import simple_mask_function
+from ..helpers.earthengine import get_area_km2_image, get_sum_reducer
 from ..helpers.logging import get_logger
-from ..helpers.util import abspath
+from ..helpers.util import abspath, cached_property
 
 logger = get_logger("modis-evi")
 
@@ -49,6 +50,29 @@ Metric = collections.namedtuple(
 )
 
 
+@functools.lru_cache(maxsize=None)
+def _sorted_datasets(dataset_items):
+    """Sorts (year, asset id) pairs by year, once per dataset config."""
+
+    return tuple(sorted(dataset_items, key=lambda t: t[0]))
+
+
+@functools.lru_cache(maxsize=None)
+def _build_ee_images(dataset_items):
+    """
+    Stacks the yearly evi assets, weighted by pixel area, over non-negative pixels.
+    :param dataset_items: tuple of (year, asset id) pairs, sorted by year
+    :return: per year area weighted evi image, with an area band
+    """
+    ee_im_area = get_area_km2_image()  # km2
+
+    # one band per year, masked and multiplied by the pixel area in a single expression
+    ee_im = ee.Image.cat([ee.Image(v).rename([str(k)]) for k, v in dataset_items])
+    ee_im = ee_im.updateMask(ee_im.gte(0)).multiply(ee_im_area)
+
+    return ee_im.addBands(ee_im_area)
+
+
 class ModisEvi(MetricBase):
     """
     Calculates total evi per year as well as a mean evi for all the years.
@@ -78,33 +102,31 @@ class ModisEvi(MetricBase):
         # config
         self._ee_dataset = self._config.get_property("metrics.modis_evi.dataset")
 
-        # dictionary sorted by key
-        datasets = collections.OrderedDict(
-            sorted(self._ee_dataset.items(), key=lambda t: t[0])
-        )
-
-        self._years = [str(e) for e in datasets.keys()]
-
-        # initialize ee.Images to be used for zonal statistics later
-        area_im = ee.Image.pixelArea()  # area of the pixel in m2
-        ee_im_area = area_im.divide(1e6).rename(["area"])  # km2
+        # datasets sorted by key
+        self._datasets = _sorted_datasets(tuple(self._ee_dataset.items()))
+        self._years = [str(k) for k, _ in self._datasets]
+        self._year_idx = {year: i for i, year in enumerate(self._years)}
 
-        ee_masked_im = {}
-        for k, v in datasets.items():
-            tmp_im = ee.Image(v)
-            masked_im = simple_mask_function(tmp_im, tmp_im, gte=0)
+        # regression x values are fixed per instance, precompute their moments
+        self._x = np.array([int(year) for year in self._years], dtype=np.float64)
+        self._x_mean = self._x.mean()
+        self._x_ss = ((self._x - self._x_mean) ** 2).sum()
 
-            scaled_im = masked_im.multiply(
-                ee_im_area
-            )  # pixel value multiplied by the pixel area
-            ee_masked_im[str(k)] = scaled_im
-
-        ee_masked_im["area"] = ee_im_area
-
-        ee_im_col = ee.ImageCollection(list(ee_masked_im.values()))
-        ee_im = ee_im_col.toBands()
+    @cached_property
+    def _reducers(self):
+        """
+        Single sum over the yearly area weighted evi bands.
+        """
+        ee_im = _build_ee_images(self._datasets)
 
-        self._ee_im = ee_im.rename(list(ee_masked_im.keys()))
+        # gets the sum of all the pixel value times the pixel area within a shape
+        return {
+            "modis_evi": {
+                "reducer": get_sum_reducer(),
+                "image": ee_im,
+                "band": False,  # key is not a band name
+            }
+        }
 
     def measure(self, gdf, area_km2=None):
         super().measure(gdf, area_km2)
@@ -112,17 +134,8 @@ class ModisEvi(MetricBase):
         # creates a featCol from target geom (i.e. multi-poly --> polygons)
         feats = self._breakdown_shape(gdf)
 
-        # reducer dict - keys match bands in raster
-        # gets the sum of all the pixel value times the pixel area within a shape
-        reducers = {
-            "modis_evi": {
-                "reducer": ee.Reducer.sum().unweighted(),
-                "image": self._ee_im,
-                "band": False,  # key is not a band name
-            }
-        }
         # ee compute area
-        ee_data = self._intersect(feats, reducers, self._scale)
+        ee_data = self._intersect_iter(feats, self._reducers, self._scale)
 
         # aggregate data
         raw_data = self._aggregate(ee_data)
@@ -135,10 +148,7 @@ class ModisEvi(MetricBase):
         :param data: JSON object
         :return: Metric object
         """
-        year_data = {
-            year: dict(year=int(year), value=0, norm=0, rescale=0)
-            for year in self._years
-        }
+        values = np.zeros(len(self._years))
 
         area_km2 = 0
         for loc in data:
@@ -146,46 +156,41 @@ class ModisEvi(MetricBase):
                 if k == "area":
                     area_km2 += v
                 else:
-                    year_data[k]["value"] += v
+                    values[self._year_idx[k]] += v
 
-        for data in year_data.values():
-            data["norm"] = data["value"] / area_km2
+        norm = values / area_km2
 
         # rescales the values from 0 to 1
-        max_norm = max([data["norm"] for data in year_data.values()])
-
-        for data in year_data.values():
-            data["rescale"] = data["norm"] / max_norm
+        rescale = norm / norm.max()
 
-        mean = sum([e["value"] for e in year_data.values()]) / len(year_data.values())
+        mean = values.mean()
         mean_norm = mean / area_km2
 
         # calculate thresholds
-        std = (
-            sum([(v["norm"] - mean_norm) ** 2 for v in year_data.values()])
-            / len(year_data)
-        ) ** 0.5
+        std = norm.std()
         std_p1 = mean_norm + std
         std_m1 = mean_norm - std
         std_p2 = mean_norm + 2 * std
         std_m2 = mean_norm - 2 * std
 
-        # calculate regression line
-        min_year = int(self._years[0])
-        max_year = int(self._years[-1])
-        x = np.array(range(min_year, max_year + 1))
-        y = np.array([v["norm"] for v in year_data.values()])
-
         # calculates the slope of the regression line, which follows the equation y = mx + c
-        mc = np.polyfit(x, y, 1)
-        y_predict = [
-            (mc[0] * v + mc[1]) for v in x
-        ]  # calculates the regression line using the equation y = mx +c
-        rg_start = y_predict[0]  # regression line start value
-        rg_end = y_predict[-1]  # regression line end value
+        # closed-form least squares: m = cov(x, y) / var(x), c = mean(y) - m * mean(x)
+        x = self._x
+        norm_mean = norm.mean()
+        m = ((x - self._x_mean) * (norm - norm_mean)).sum() / self._x_ss
+        c = norm_mean - m * self._x_mean
+        rg_start = m * x[0] + c  # regression line start value
+        rg_end = m * x[-1] + c  # regression line end value
+
+        year_data = [
+            dict(year=int(year), value=value, norm=n, rescale=r)
+            for year, value, n, r in zip(
+                self._years, values.tolist(), norm.tolist(), rescale.tolist()
+            )
+        ]
 
         return {
-            "year_data": list(year_data.values()),
+            "year_data": year_data,
             "mean": mean,
             "mean_norm": mean_norm,
             "area_km2": area_km2,
@@ -193,9 +198,9 @@ class ModisEvi(MetricBase):
             "std_m1": std_m1,
             "std_p2": std_p2,
             "std_m2": std_m2,
-            "rg_slope": mc[0],
+            "rg_slope": m,
             "rg_start": rg_start,
-            "rg_end": rg_end,  # gets the slope (m) from the mc element
+            "rg_end": rg_end,
         }
 
     def _package_metric(self, raw_data):
@@ -18,13 +18,18 @@
 """
 
 import collections
+import functools
 import ee
-from datetime import timedelta, datetime
+from datetime import date, timedelta, datetime
 
-from .base.metric_base import MetricBase, MetricPackageException
-from ..helpers.earthengine import filter_fires
+from .base.metric_base import (
+    MetricBase,
+    MetricComputeException,
+    MetricPackageException,
+)
+from ..helpers.earthengine import filter_fires, get_area_km2_image, get_sum_reducer
 from ..helpers.logging import get_logger
-from ..helpers.util import abspath
+from ..helpers.util import abspath, cached_property
 
 logger = get_logger("modis-fire")
 
@@ -35,6 +40,77 @@ Metric = collections.namedtuple(
 )
 
 
+@functools.lru_cache(maxsize=None)
+def _dataset_date_range(dataset):
+    """
+    Fetches the first and last image dates of the fires collection.
+    Only the two boundary indexes are transferred, in a single round-trip.
+    :param dataset: asset id
+    :return: start and end dates (YYYY-MM-DD)
+    """
+    index = ee.ImageCollection(dataset).aggregate_array("system:index")
+    dates = ee.List([index.get(0), index.get(-1)]).getInfo()
+
+    return tuple(d.replace("_", "-") for d in dates)
+
+
+def _iso_date(year, week, day):
+    """
+    Date of an ISO calendar date (Monday is 1, Sunday is 7).
+    Same result as date.fromisocalendar(...) (Python 3.8+).
+    """
+    jan_4 = date(year, 1, 4)  # always in iso-week 1
+    week_1_monday = jan_4 - timedelta(days=jan_4.weekday())
+
+    return week_1_monday + timedelta(weeks=week - 1, days=day - 1)
+
+
+def _burn_day_bounds(first_day, last_day):
+    """
+    Splits a date range into per calendar year day-of-year bounds, BurnDate is a
+    day of year so each year is masked against its own mosaic.
+    :return: tuple of (year, first day of year, last day of year), inclusive
+    """
+    first_yday = first_day.timetuple().tm_yday
+    last_yday = last_day.timetuple().tm_yday
+    if first_day.year == last_day.year:
+        return ((first_day.year, first_yday, last_yday),)
+
+    year_end = date(first_day.year, 12, 31).timetuple().tm_yday
+    return ((first_day.year, first_yday, year_end), (last_day.year, 1, last_yday))
+
+
+@functools.lru_cache(maxsize=None)
+def _generate_isoweeks(start_date, end_date):
+    """
+    Generates start and end dates for each iso-week between start and end dates.
+    Each week counts the burn days from its saturday to the following friday.
+    :param start_date: YYYY-MM-DD
+    :param end_date: YYYY-MM-DD
+    :return: tuple of iso-week dicts, shared between callers
+    """
+    generated_weeks = []
+    start = datetime.strptime(start_date, "%Y-%m-%d")
+    end = datetime.strptime(end_date, "%Y-%m-%d")
+    while start < end - timedelta(weeks=1):
+        tmp_end = start + timedelta(weeks=1)
+        start_year, start_isoweek, _ = start.isocalendar()
+
+        saturday = _iso_date(start_year, start_isoweek, 6)
+        generated_weeks.append(
+            {
+                "bounds": _burn_day_bounds(saturday, saturday + timedelta(days=6)),
+                "start_date": start.date().isoformat(),
+                "end_date": tmp_end.date().isoformat(),
+                "year": start_year,
+                "isoweek": start_isoweek,
+            }
+        )
+        start = tmp_end
+
+    return tuple(generated_weeks)
+
+
 class ModisFire(MetricBase):
     """
     Calculates fire metric.
@@ -64,84 +140,74 @@ class ModisFire(MetricBase):
         # config
         self._ee_dataset = self._config.get_property("metrics.modis_fire.dataset")
 
-        # initialize ee.Images to be used for zonal statistics later
-        ee_im_fires = ee.ImageCollection(self._ee_dataset).map(filter_fires)
-        area_im = ee.Image.pixelArea()  # area raster
-        self._ee_im_area = area_im.divide(1e6).rename(["area"])  # km2
-
-        # set start and end dates
-        im_date_list = [
-            d.replace("_", "-")
-            for d in ee_im_fires.aggregate_array("system:index").getInfo()
+        # set start and end dates, only querying the dataset when not given
+        start_date = kwargs.get("start_date")
+        end_date = kwargs.get("end_date")
+        if start_date is None or end_date is None:
+            first_date, last_date = _dataset_date_range(self._ee_dataset)
+            start_date = start_date or first_date
+            end_date = end_date or last_date
+
+        self.start_date = start_date
+        self.end_date = end_date
+        self._iso_weeks = self._generate_isoweek()
+        self._iso_week_keys = [
+            (d["year"], d["isoweek"], f"{d['year']}-{d['isoweek']}")
+            for d in self._iso_weeks
         ]
+        if not self._iso_week_keys:
+            raise MetricComputeException(
+                f"Could not compute metric. No iso-week from {start_date} to {end_date}"
+            )
 
-        self.start_date = kwargs.get("start_date", im_date_list[0])
-        self.end_date = kwargs.get("end_date", im_date_list[-1])
-
-        start_year = int(self.start_date.split("-")[0])
-        end_year = int(self.end_date.split("-")[0])
-
-        images = {}
-        dates = self._generate_isoweek()
-
-        for year in range(start_year, end_year + 1):
+    @cached_property
+    def _reducers(self):
+        """
+        Single sum over the iso-week burnt area bands.
+        """
+        # initialize ee.Images to be used for zonal statistics later
+        ee_im_fires = ee.ImageCollection(self._ee_dataset).map(filter_fires)
+        ee_im_area = get_area_km2_image()  # km2
+
+        # a week crossing the year end is masked against both mosaics,
+        # one band per year it touches, summed back in _aggregate
+        bounds_by_year = collections.defaultdict(list)
+        for d in self._iso_weeks:
+            for year, first_day, last_day in d["bounds"]:
+                key = f"{d['year']}-{d['isoweek']}"
+                bounds_by_year[year].append((f"{key}_{year}", first_day, last_day))
+
+        images = []
+        for year, bounds in sorted(bounds_by_year.items()):
             image = (
-                ee_im_fires.filterDate(f"{year}-01-01", f"{year}-12-31")
+                ee_im_fires.filterDate(f"{year}-01-01", f"{year + 1}-01-01")
                 .select("BurnDate")
                 .mosaic()
             )
-            filtered_dates = [d for d in dates if d["year"] == year]
-
-            for d in filtered_dates:
-                start_day = int(d["start"])
-                end_day = int(d["end"]) - 1
-                year = d["year"]
-                week = d["isoweek"]
-                if start_day > end_day:
-                    mask = image.gte(start_day).Or(image.lt(end_day))
-                    masked = self._ee_im_area.updateMask(mask)
-                else:
-                    mask = image.gte(start_day).And(image.lt(end_day))
-                    masked = self._ee_im_area.updateMask(mask)
-                images[f"{year}-{week}"] = masked
-
-        ee_im_col = ee.ImageCollection(list(images.values()))
-        ee_im = ee_im_col.toBands()
-
-        self._ee_im = ee_im.rename(list(images.keys()))
+
+            # mask every iso-week at once against multi-band day constants
+            keys = [k for k, _, _ in bounds]
+            first_days = ee.Image.constant([first_day for _, first_day, _ in bounds])
+            last_days = ee.Image.constant([last_day for _, _, last_day in bounds])
+            mask = image.gte(first_days).And(image.lte(last_days))
+
+            images.append(mask.multiply(ee_im_area).rename(keys))
+
+        ee_im = ee.Image.cat(images)
+
+        return {
+            "modis_fire": {
+                "reducer": get_sum_reducer(),
+                "image": ee_im,
+                "band": False,  # key is not a band name
+            }
+        }
 
     def _generate_isoweek(self):
         """
         Generates start and end dates for each iso-week between start and end dates.
         """
-        generated_weeks = []
-        start = datetime.strptime(self.start_date, "%Y-%m-%d")
-        end = datetime.strptime(self.end_date, "%Y-%m-%d")
-        while start < end - timedelta(weeks=1):
-            tmp_end = start + timedelta(weeks=1)
-            start_year, start_isoweek, _ = start.isocalendar()
-            end_year, end_isoweek, _ = tmp_end.isocalendar()
-
-            day_start = datetime.strptime(
-                f"{start_year}-{start_isoweek}-6", "%Y-%W-%w"
-            ).strftime("%j")
-            day_end = datetime.strptime(
-                f"{end_year}-{end_isoweek}-0", "%Y-%W-%w"
-            ).strftime("%j")
-
-            generated_weeks.append(
-                {
-                    "start": int(day_start),
-                    "end": int(day_end),
-                    "start_date": start.strftime("%Y-%m-%d"),
-                    "end_date": tmp_end.strftime("%Y-%m-%d"),
-                    "year": start_year,
-                    "isoweek": start_isoweek,
-                }
-            )
-            start = tmp_end
-
-        return generated_weeks
+        return _generate_isoweeks(self.start_date, self.end_date)
 
     def measure(self, gdf, area_km2=None):
         super().measure(gdf, area_km2)
@@ -149,17 +215,8 @@ class ModisFire(MetricBase):
         # creates a list of ee.Features from target geom (i.e. multi-poly --> polygons)
         feats = self._breakdown_shape(gdf)
 
-        # reducer dict - keys match bands in raster
-        reducers = {
-            "modis_fire": {
-                "reducer": ee.Reducer.sum().unweighted(),
-                "image": self._ee_im,
-                "band": False,  # key is not a band name
-            }
-        }
-
         # ee compute area
-        ee_data = self._intersect(feats, reducers, self._scale)
+        ee_data = self._intersect_iter(feats, self._reducers, self._scale)
 
         # aggregate data
         raw_data = self._aggregate(ee_data)
@@ -172,27 +229,15 @@ class ModisFire(MetricBase):
         :param data: JSON object
         :return: Metric object
         """
-        iso_weeks = self._generate_isoweek()
-
-        for date in iso_weeks:
-            iso_date = f"{date['year']}-{date['isoweek']}"
-
-            # get same date from all locations
-            filtered_values = []
-            for loc in data:
-                for k, v in loc["modis_fire"].items():
-                    if k == iso_date:
-                        filtered_values.append(v)
-
-            total_area = 0
-            if len(filtered_values) != 0:
-                total_area = sum(filtered_values)
-
-            date["value"] = total_area
+        # sum each iso-week band over all locations and calendar years
+        totals = collections.defaultdict(int)
+        for loc in data:
+            for k, v in loc["modis_fire"].items():
+                totals[k.rsplit("_", 1)[0]] += v
 
         return [
-            dict(year=d["year"], isoweek=d["isoweek"], value=d["value"])
-            for d in iso_weeks
+            dict(year=year, isoweek=isoweek, value=totals.get(key, 0))
+            for year, isoweek, key in self._iso_week_keys
         ]
 
     def _package_metric(self, raw_data):
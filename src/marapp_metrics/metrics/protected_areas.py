@@ -18,12 +18,17 @@
 """
 
 import collections
+import functools
 import ee
 
 from .base.metric_base import MetricBase, MetricPackageException
-from ..helpers.earthengine import simple_mask_function
+from ..helpers.earthengine import (
+    get_area_km2_image,
+    get_sum_reducer,
+    simple_mask_function,
+)
 from ..helpers.logging import get_logger
-from ..helpers.util import abspath
+from ..helpers.util import abspath, cached_property
 
 logger = get_logger("protected-areas")
 
@@ -42,6 +47,26 @@ Metric = collections.namedtuple(
 )
 
 
+@functools.lru_cache(maxsize=None)
+def _build_ee_images(dataset):
+    """
+    Splits the pixel area into unprotected, land and marine protected areas.
+    :param dataset: asset id
+    :return: area by protection type image, one band per type
+    """
+    ee_im = ee.Image(dataset).rename(["pa"])  # converting asset into an image
+    ee_im_area = get_area_km2_image()  # km2
+
+    # mask each category to get area
+    ee_im_unprotected = simple_mask_function(ee_im_area, ee_im, eq=0)
+    ee_im_land = simple_mask_function(ee_im_area, ee_im, eq_or=[1, 3])
+    ee_im_marine = simple_mask_function(ee_im_area, ee_im, eq=2)
+
+    return ee.Image.cat(
+        [ee_im_area, ee_im_unprotected, ee_im_land, ee_im_marine]
+    ).rename(["area", "area_unprotected", "area_land", "area_marine"])
+
+
 class ProtectedAreas(MetricBase):
     """
     Breakdown of land area protected by type: Marine, Land, Both, No Protection
@@ -71,24 +96,18 @@ class ProtectedAreas(MetricBase):
         # config
         self._ee_dataset = self._config.get_property("metrics.protected_areas.dataset")
 
-        # initialize ee.Images to be used for zonal statistics later
-        area_im = ee.Image.pixelArea()  # area raster
-        self._ee_im = ee.Image(self._ee_dataset).rename(
-            ["pa"]
-        )  # converting asset into an image
-        self._ee_im_area = area_im.divide(1e6).rename(["area"])  # km2
-
-        # mask each category to get area
-        # collapse into Image collection?
-        self._ee_im_unprotected = simple_mask_function(
-            self._ee_im_area, self._ee_im, eq=0
-        ).rename(["area_unprotected"])
-        self._ee_im_land = simple_mask_function(
-            self._ee_im_area, self._ee_im, eq_or=[1, 3]
-        ).rename(["area_land"])
-        self._ee_im_marine = simple_mask_function(
-            self._ee_im_area, self._ee_im, eq=2
-        ).rename(["area_marine"])
+    @cached_property
+    def _reducers(self):
+        """
+        Single sum over the per protection type area bands.
+        """
+        return {
+            "protected_areas": {
+                "reducer": get_sum_reducer(),
+                "image": _build_ee_images(self._ee_dataset),
+                "band": False,  # key is not a band name
+            }
+        }
 
     def measure(self, gdf, area_km2=None):
         super().measure(gdf, area_km2)
@@ -97,33 +116,9 @@ class ProtectedAreas(MetricBase):
             gdf
         )  # creates a featCol from target geom (i.e. multi-poly --> polygons)
 
-        # reducer dict - keys match bands in raster
-        reducers = {
-            "area": {
-                "reducer": ee.Reducer.sum().unweighted(),
-                "image": self._ee_im_area,
-                "band": True,
-            },
-            "area_unprotected": {
-                "reducer": ee.Reducer.sum().unweighted(),
-                "image": self._ee_im_unprotected,
-                "band": True,
-            },
-            "area_land": {
-                "reducer": ee.Reducer.sum().unweighted(),
-                "image": self._ee_im_land,
-                "band": True,
-            },
-            "area_marine": {
-                "reducer": ee.Reducer.sum().unweighted(),
-                "image": self._ee_im_marine,
-                "band": True,
-            },
-        }
-
         # ee compute area
-        ee_data = self._intersect(feats, reducers, self._scale)
-        logger.info(ee_data[0])
+        ee_data = self._intersect_iter(feats, self._reducers, self._scale)
+
         # aggregate data
         raw_data = self._aggregate(ee_data)
 
@@ -135,10 +130,16 @@ class ProtectedAreas(MetricBase):
         :param data: JSON object
         :return: Metric object
         """
-        area = sum([d["area"] for d in data])
-        metric_area_unprotected = sum([d["area_unprotected"] for d in data])
-        metric_area_land = sum([d["area_land"] for d in data])
-        metric_area_marine = sum([d["area_marine"] for d in data])
+        area = 0
+        metric_area_unprotected = 0
+        metric_area_land = 0
+        metric_area_marine = 0
+        for loc in data:
+            d = loc["protected_areas"]
+            area += d["area"]
+            metric_area_unprotected += d["area_unprotected"]
+            metric_area_land += d["area_land"]
+            metric_area_marine += d["area_marine"]
 
         return {
             "area": area,
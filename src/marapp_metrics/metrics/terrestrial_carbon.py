@@ -21,9 +21,14 @@ import collections
 import ee
 
 from .base.metric_base import MetricBase, MetricPackageException
-from ..helpers.earthengine import simple_mask_function
+from ..helpers.earthengine import (
+    get_area_ha_image,
+    get_area_km2_image,
+    get_sum_reducer,
+    simple_mask_function,
+)
 from ..helpers.logging import get_logger
-from ..helpers.util import abspath
+from ..helpers.util import abspath, cached_property
 
 logger = get_logger("terrestrial-carbon")
 
@@ -76,25 +81,36 @@ class TerrestrialCarbon(MetricBase):
             "metrics.terrestrial_carbon.dataset"
         )
 
-        # initialize ee.Images to be used for zonal statistics later
-        area_im = ee.Image.pixelArea()  # area raster
-        self._ee_im_area = area_im.divide(1e6).rename(["area"])  # km2
+    @cached_property
+    def _reducers(self):
+        """
+        Single sum over stacked carbon, total biomass (t) and area (km2) bands.
+        """
+        area_ha_im = get_area_ha_image()  # ha
+        ee_im_area = get_area_km2_image()  # km2
 
         # Biomass carbon density
         _ee_im_carbon = ee.Image(self._ee_dataset.get("carbon"))
         _ee_im_carbon_density = simple_mask_function(
             _ee_im_carbon, _ee_im_carbon, gte=0
         )
-        _ee_im_carbon = _ee_im_carbon_density.multiply(area_im).divide(1e4)  # ha
+        _ee_im_carbon = _ee_im_carbon_density.multiply(area_ha_im)  # ha
 
         # Total density
         _ee_im_total = ee.Image(self._ee_dataset.get("total"))
         _ee_im_total_density = simple_mask_function(_ee_im_total, _ee_im_total, gte=0)
-        _ee_im_total = _ee_im_total_density.multiply(area_im).divide(1e4)  # ha
+        _ee_im_total = _ee_im_total_density.multiply(area_ha_im)  # ha
+
+        ee_im = ee.Image.cat([_ee_im_carbon, _ee_im_total, ee_im_area])
+        ee_im = ee_im.rename(["carbon", "total", "area"])
 
-        _ee_im_col = ee.ImageCollection([_ee_im_carbon, _ee_im_total, self._ee_im_area])
-        _ee_im = _ee_im_col.toBands()
-        self._ee_im = _ee_im.rename(["carbon", "total", "area"])
+        return {
+            "terrestrial_carbon": {
+                "reducer": get_sum_reducer(),
+                "image": ee_im,
+                "band": False,  #  key is not a band name
+            }
+        }
 
     def measure(self, gdf, area_km2=None):
         super().measure(gdf, area_km2)
@@ -103,17 +119,8 @@ class TerrestrialCarbon(MetricBase):
             gdf
         )  # creates a list of ee.Features from target geom (i.e. multi-poly --> polygons)
 
-        # reducer dict - keys match bands in raster
-        reducers = {
-            "terrestrial_carbon": {
-                "reducer": ee.Reducer.sum().unweighted(),
-                "image": self._ee_im,
-                "band": False,  #  key is not a band name
-            }
-        }
-
         # ee compute area
-        ee_data = self._intersect(feats, reducers, self._scale)
+        ee_data = self._intersect_iter(feats, self._reducers, self._scale)
 
         # aggregate data
         raw_data = self._aggregate(ee_data)
@@ -126,9 +133,14 @@ class TerrestrialCarbon(MetricBase):
         :param data: JSON object
         :return: Metric object
         """
-        area = sum([d["terrestrial_carbon"]["area"] for d in data])
-        metric_total = sum([d["terrestrial_carbon"]["total"] for d in data])
-        metric_carbon = sum([d["terrestrial_carbon"]["carbon"] for d in data])
+        area = 0
+        metric_total = 0
+        metric_carbon = 0
+        for loc in data:
+            d = loc["terrestrial_carbon"]
+            area += d["area"]
+            metric_total += d["total"]
+            metric_carbon += d["carbon"]
 
         return {
             "area": area,
@@ -142,7 +154,7 @@ class TerrestrialCarbon(MetricBase):
         :param self:
         :return: Metric object
         """
-        if not raw_data:
+        if not raw_data or not raw_data["area"]:
             raise MetricPackageException("Could not package metric for geometry")
 
         metric = Metric(
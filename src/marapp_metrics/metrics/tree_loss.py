@@ -18,12 +18,13 @@
 """
 
 import collections
+import functools
 import ee
 
 from .base.metric_base import MetricBase, MetricPackageException
-from ..helpers.earthengine import simple_mask_function
+from ..helpers.earthengine import get_area_km2_image, get_sum_reducer
 from ..helpers.logging import get_logger
-from ..helpers.util import abspath
+from ..helpers.util import abspath, cached_property
 
 logger = get_logger("tree-loss")
 
@@ -34,6 +35,21 @@ Metric = collections.namedtuple(
 )
 
 
+@functools.lru_cache(maxsize=None)
+def _build_ee_images(dataset):
+    """
+    Pairs the pixel area with its loss year, for a sum grouped by year.
+    :param dataset: asset id
+    :return: ee.Image with the area band first and the loss year band second
+    """
+    ee_im_area = get_area_km2_image()  # km2
+
+    # no loss (0) and masked pixels are grouped together as year 0
+    ee_im_loss = ee.Image(dataset).select("lossyear_30").unmask(0).rename(["year"])
+
+    return ee.Image.cat([ee_im_area, ee_im_loss])
+
+
 class TreeLoss(MetricBase):
     """
     Calculates tree cover loss area at 30% tree cover threshold between 2001 and 2018.
@@ -65,20 +81,18 @@ class TreeLoss(MetricBase):
         # config
         self._ee_dataset = self._config.get_property("metrics.tree_loss.dataset")
 
-        # initialize ee.Images to be used for zonal statistics later
-        area_im = ee.Image.pixelArea()  # area raster
-        self._ee_im_area = area_im.divide(1e6).rename(["area"])  # km2
-
-        _ee_im_loss = ee.Image(self._ee_dataset).select("lossyear_30")
-        _ee_im_dict = {"area": self._ee_im_area}
-        for j in range(1, self.years + 1):
-            year = 2000 + j
-            _ee_im_year = simple_mask_function(self._ee_im_area, _ee_im_loss, eq=j)
-            _ee_im_dict[f"{year}"] = _ee_im_year
-
-        _ee_im_col = ee.ImageCollection(list(_ee_im_dict.values()))
-        _ee_im = _ee_im_col.toBands()
-        self._ee_im = _ee_im.rename(list(_ee_im_dict.keys()))
+    @cached_property
+    def _reducers(self):
+        """
+        Area sum grouped by loss year, in a single pass.
+        """
+        return {
+            "tree_loss": {
+                "reducer": get_sum_reducer().group(groupField=1, groupName="year"),
+                "image": _build_ee_images(self._ee_dataset),
+                "band": False,  # key is not a band name
+            }
+        }
 
     def measure(self, gdf, area_km2=None):
         super().measure(gdf, area_km2)
@@ -87,17 +101,8 @@ class TreeLoss(MetricBase):
             gdf
         )  # creates a featCol from target geom (i.e. multi-poly --> polygons)
 
-        # reducer dict - keys match bands in raster
-        reducers = {
-            "tree_loss": {
-                "reducer": ee.Reducer.sum().unweighted(),
-                "image": self._ee_im,
-                "band": False,  # key is not a band name
-            }
-        }
-
         # ee compute area
-        ee_data = self._intersect(feats, reducers, self._scale)
+        ee_data = self._intersect_iter(feats, self._reducers, self._scale)
 
         # aggregate data
         raw_data = self._aggregate(ee_data)
@@ -114,11 +119,11 @@ class TreeLoss(MetricBase):
 
         area = 0
         for location in data:
-            for k, v in location["tree_loss"].items():
-                if k != "area":
-                    tmp_parsed_data[k] += v
-                else:
-                    area += v
+            for group in location["tree_loss"]["groups"]:
+                area += group["sum"]
+                year = int(group["year"])
+                if 0 < year <= self.years:
+                    tmp_parsed_data[f"{2000 + year}"] += group["sum"]
 
         return {"year_data": tmp_parsed_data, "area": area}
 
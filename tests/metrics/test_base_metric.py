@@ -17,22 +17,36 @@
   specific language governing permissions and limitations under the License.
 """
 
+import math
+
 import ee
 import pytest
-from marapp_metrics.metrics.base.metric_base import MetricBase
+from marapp_metrics.metrics.base.metric_base import MetricBase, measure_batch
+from marapp_metrics.metrics.biodiversity_intactness import (
+    BiodiversityIntactnessMetric,
+)
+from marapp_metrics.metrics.protected_areas import ProtectedAreas
+from marapp_metrics.metrics.tree_loss import TreeLoss
 from marapp_metrics.helpers.util import abspath
 
+from ..util import traverse_nested, deepgetattr, geojson_reader, metric_handler
+
+
+@pytest.fixture(scope="module")
+def base():
+    return MetricBase(
+        config_filepath=abspath(__file__, "../../src/marapp_metrics/earthengine.yaml")
+    )
+
 
 @pytest.mark.basic
 @pytest.mark.parametrize(
     "shape_path,metric_path",
     [("fixtures/shapes/canada-feature-collection.geojson", "",)],
+    ids=["canada"],
 )
-def test_create_grid(shape_path, metric_path):
+def test_create_grid(base, shape_path, metric_path):
     degrees = 0.5
-    base = MetricBase(
-        config_filepath=abspath(__file__, "../../src/marapp_metrics/earthengine.yaml")
-    )
 
     # Create the geometry.
     polygon = ee.Geometry.Polygon([[[0, 0], [10, 0], [10, 10], [0, 10], [0, 0]]])
@@ -47,11 +61,9 @@ def test_create_grid(shape_path, metric_path):
 @pytest.mark.parametrize(
     "shape_path,metric_path",
     [("fixtures/shapes/canada-feature-collection.geojson", "",)],
+    ids=["canada"],
 )
-def test_create_grid_intersections(shape_path, metric_path):
-    base = MetricBase(
-        config_filepath=abspath(__file__, "../../src/marapp_metrics/earthengine.yaml")
-    )
+def test_create_grid_intersections(base, shape_path, metric_path):
     degrees = 0.5
 
     # Create the geometry (triangle)
@@ -61,3 +73,75 @@ def test_create_grid_intersections(shape_path, metric_path):
 
     # Check that unnecessary grids are dropped
     assert len(grids) < 20 * (20 + 1)
+
+
+@pytest.mark.basic
+@pytest.mark.parametrize(
+    "shape_path,metric_path",
+    [("fixtures/shapes/romania-feature-collection.geojson", "",)],
+    ids=["romania"],
+)
+def test_measure_batch(shape_path, metric_path):
+    # Load the geometry..
+    gdf = geojson_reader(shape_path)
+    assert not gdf.empty
+
+    handlers = [
+        metric_handler(
+            metric_cls,
+            config_filepath=abspath(
+                __file__, "../../src/marapp_metrics/earthengine.yaml"
+            ),
+        )
+        for metric_cls in [TreeLoss, ProtectedAreas, BiodiversityIntactnessMetric]
+    ]
+
+    # Compute the metrics together and one by one..
+    batch_metrics = measure_batch(handlers, gdf)
+    assert len(batch_metrics) == len(handlers)
+
+    for handler, batch_metric in zip(handlers, batch_metrics):
+        metric_data = handler.measure(gdf)._asdict()
+        batch_data = batch_metric._asdict()
+
+        # Compare batch results with the individual metric..
+        for nested_key, value in traverse_nested(metric_data):
+            if isinstance(value, float):
+                assert deepgetattr(batch_data, nested_key) == pytest.approx(
+                    value, abs=1e-2
+                )
+            else:
+                assert deepgetattr(batch_data, nested_key) == value
+
+
+@pytest.mark.basic
+@pytest.mark.parametrize(
+    "shape_path,metric_path",
+    [("fixtures/shapes/romania-feature-collection.geojson", "",)],
+    ids=["romania"],
+)
+def test_intersect_cache(shape_path, metric_path):
+    # Load the geometry..
+    gdf = geojson_reader(shape_path)
+    assert not gdf.empty
+
+    # Plain dict as the cache store, shared between handlers
+    cache = {}
+    config_filepath = abspath(__file__, "../../src/marapp_metrics/earthengine.yaml")
+    handler = TreeLoss(config_filepath=config_filepath, cache=cache)
+
+    # First run fills the cache, one entry per chunk..
+    metric = handler.measure(gdf)
+    num_chunks = math.ceil(len(handler._breakdown_shape(gdf)) / handler.chunk_size)
+    assert len(cache) == num_chunks
+
+    # Second run on the same shape is served from the cache..
+    assert handler.measure(gdf) == metric
+    assert len(cache) == num_chunks
+
+    # A different scale changes the reduce graph, so it gets its own keys
+    handler_scale = TreeLoss(
+        config_filepath=config_filepath, cache=cache, scale=handler._scale * 2
+    )
+    handler_scale.measure(gdf)
+    assert len(cache) == 2 * num_chunks
@@ -28,6 +28,7 @@ from ..util import (
     deepgetattr,
     geojson_reader,
     json_writer,
+    metric_handler,
 )
 
 logger = logging.getLogger(__name__)
@@ -50,13 +51,15 @@ logger = logging.getLogger(__name__)
             "fixtures/metrics/biodiversity-intactness/france-data.json",
         ),
     ],
+    ids=["romania", "spain", "france"],
 )
 def test_compute_basic(shape_path, metric_path):
     # Load the geometry..
     gdf = geojson_reader(shape_path)
     assert not gdf.empty
 
-    handler = BiodiversityIntactnessMetric(
+    handler = metric_handler(
+        BiodiversityIntactnessMetric,
         config_filepath=abspath(__file__, "../../src/marapp_metrics/earthengine.yaml"),
     )
 
@@ -68,6 +71,7 @@ def test_compute_basic(shape_path, metric_path):
     precomputed_data = json_reader(metric_path, True)
     if precomputed_data is None:
         json_writer(metric_path, metric_data)
+        return
 
     # Compare results with precomputed metrics..
     for nested_key, value in traverse_nested(precomputed_data):
@@ -96,13 +100,15 @@ def test_compute_basic(shape_path, metric_path):
             "fixtures/metrics/biodiversity-intactness/africa-gridded-data.json",
         ),
     ],
+    ids=["canada", "russia", "africa"],
 )
 def test_compute_grid(shape_path, metric_path):
     # Load the geometry..
     gdf = geojson_reader(shape_path)
     assert not gdf.empty
 
-    handler = BiodiversityIntactnessMetric(
+    handler = metric_handler(
+        BiodiversityIntactnessMetric,
         config_filepath=abspath(__file__, "../../src/marapp_metrics/earthengine.yaml"),
         grid=True,
         simplify=True,
@@ -117,6 +123,7 @@ def test_compute_grid(shape_path, metric_path):
     precomputed_data = json_reader(metric_path, True)
     if precomputed_data is None:
         json_writer(metric_path, metric_data)
+        return
 
     # Compare results with precomputed metrics
     for nested_key, value in traverse_nested(precomputed_data):
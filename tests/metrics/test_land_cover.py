@@ -26,6 +26,7 @@ from ..util import (
     deepgetattr,
     geojson_reader,
     json_writer,
+    metric_handler,
 )
 
 
@@ -46,13 +47,15 @@ from ..util import (
             "fixtures/metrics/land-cover/france-data.json",
         ),
     ],
+    ids=["romania", "spain", "france"],
 )
 def test_compute_basic(shape_path, metric_path):
     # Load the geometry..
     gdf = geojson_reader(shape_path)
     assert not gdf.empty
 
-    handler = LandUseLandCover(
+    handler = metric_handler(
+        LandUseLandCover,
         config_filepath=abspath(__file__, "../../src/marapp_metrics/earthengine.yaml"),
     )
 
@@ -64,6 +67,7 @@ def test_compute_basic(shape_path, metric_path):
     precomputed_data = json_reader(metric_path, True)
     if precomputed_data is None:
         json_writer(metric_path, metric_data)
+        return
 
     # Compare results with precomputed metrics..
     for nested_key, value in traverse_nested(precomputed_data):
@@ -92,13 +96,15 @@ def test_compute_basic(shape_path, metric_path):
             "fixtures/metrics/land-cover/africa-gridded-data.json",
         ),
     ],
+    ids=["canada", "russia", "africa"],
 )
 def test_compute_grid(shape_path, metric_path):
     # Load the geometry..
     gdf = geojson_reader(shape_path)
     assert not gdf.empty
 
-    handler = LandUseLandCover(
+    handler = metric_handler(
+        LandUseLandCover,
         config_filepath=abspath(__file__, "../../src/marapp_metrics/earthengine.yaml"),
         grid=True,
         simplify=True,
@@ -113,6 +119,7 @@ def test_compute_grid(shape_path, metric_path):
     precomputed_data = json_reader(metric_path, True)
     if precomputed_data is None:
         json_writer(metric_path, metric_data)
+        return
 
     # Compare results with precomputed metrics
     for nested_key, value in traverse_nested(precomputed_data):
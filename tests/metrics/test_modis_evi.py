@@ -28,6 +28,7 @@ from ..util import (
     deepgetattr,
     geojson_reader,
     json_writer,
+    metric_handler,
 )
 
 
@@ -48,13 +49,15 @@ from ..util import (
             "fixtures/metrics/modis-evi/france-data.json",
         ),
     ],
+    ids=["romania", "spain", "france"],
 )
 def test_compute_basic(shape_path, metric_path):
     # Load the geometry..
     gdf = geojson_reader(shape_path)
     assert not gdf.empty
 
-    handler = ModisEvi(
+    handler = metric_handler(
+        ModisEvi,
         config_filepath=abspath(__file__, "../../src/marapp_metrics/earthengine.yaml"),
     )
 
@@ -66,6 +69,7 @@ def test_compute_basic(shape_path, metric_path):
     precomputed_data = json_reader(metric_path, True)
     if precomputed_data is None:
         json_writer(metric_path, metric_data)
+        return
 
     # Compare results with precomputed metrics..
     for nested_key, value in traverse_nested(precomputed_data):
@@ -94,13 +98,15 @@ def test_compute_basic(shape_path, metric_path):
             "fixtures/metrics/modis-evi/africa-gridded-data.json",
         ),
     ],
+    ids=["canada", "russia", "africa"],
 )
 def test_compute_grid(shape_path, metric_path):
     # Load the geometry..
     gdf = geojson_reader(shape_path)
     assert not gdf.empty
 
-    handler = ModisEvi(
+    handler = metric_handler(
+        ModisEvi,
         config_filepath=abspath(__file__, "../../src/marapp_metrics/earthengine.yaml"),
         grid=True,
         simplify=True,
@@ -115,6 +121,7 @@ def test_compute_grid(shape_path, metric_path):
     precomputed_data = json_reader(metric_path, True)
     if precomputed_data is None:
         json_writer(metric_path, metric_data)
+        return
 
     # Compare results with precomputed metrics
     for nested_key, value in traverse_nested(precomputed_data):
@@ -130,13 +137,15 @@ def test_compute_grid(shape_path, metric_path):
 @pytest.mark.parametrize(
     "shape_path,metric_path",
     [("fixtures/shapes/canada-feature-collection.geojson", "",)],
+    ids=["canada"],
 )
 def test_throw_area_exception(shape_path, metric_path):
     # Load the geometry..
     gdf = geojson_reader(shape_path)
     assert not gdf.empty
 
-    handler = ModisEvi(
+    handler = metric_handler(
+        ModisEvi,
         config_filepath=abspath(__file__, "../../src/marapp_metrics/earthengine.yaml"),
         use_exceeds_limit=True,
     )
@@ -18,8 +18,9 @@
 """
 
 import pytest
+from datetime import date, timedelta
 from marapp_metrics.metrics.base.metric_base import MetricComputeException
-from marapp_metrics.metrics.modis_fire import ModisFire
+from marapp_metrics.metrics.modis_fire import ModisFire, _generate_isoweeks
 from marapp_metrics.helpers.util import abspath
 
 from ..util import (
@@ -28,6 +29,7 @@ from ..util import (
     deepgetattr,
     geojson_reader,
     json_writer,
+    metric_handler,
 )
 
 
@@ -48,13 +50,15 @@ from ..util import (
             "fixtures/metrics/modis-fire/france-data.json",
         ),
     ],
+    ids=["romania", "spain", "france"],
 )
 def test_compute_basic(shape_path, metric_path):
     # Load the geometry..
     gdf = geojson_reader(shape_path)
     assert not gdf.empty
 
-    handler = ModisFire(
+    handler = metric_handler(
+        ModisFire,
         config_filepath=abspath(__file__, "../../src/marapp_metrics/earthengine.yaml"),
     )
 
@@ -66,6 +70,7 @@ def test_compute_basic(shape_path, metric_path):
     precomputed_data = json_reader(metric_path, True)
     if precomputed_data is None:
         json_writer(metric_path, metric_data)
+        return
 
     # Compare results with precomputed metrics..
     for nested_key, value in traverse_nested(precomputed_data):
@@ -94,13 +99,15 @@ def test_compute_basic(shape_path, metric_path):
             "fixtures/metrics/modis-fire/africa-gridded-data.json",
         ),
     ],
+    ids=["canada", "russia", "africa"],
 )
 def test_compute_grid(shape_path, metric_path):
     # Load the geometry..
     gdf = geojson_reader(shape_path)
     assert not gdf.empty
 
-    handler = ModisFire(
+    handler = metric_handler(
+        ModisFire,
         config_filepath=abspath(__file__, "../../src/marapp_metrics/earthengine.yaml"),
         grid=True,
         simplify=True,
@@ -115,6 +122,7 @@ def test_compute_grid(shape_path, metric_path):
     precomputed_data = json_reader(metric_path, True)
     if precomputed_data is None:
         json_writer(metric_path, metric_data)
+        return
 
     # Compare results with precomputed metrics
     for nested_key, value in traverse_nested(precomputed_data):
@@ -130,13 +138,15 @@ def test_compute_grid(shape_path, metric_path):
 @pytest.mark.parametrize(
     "shape_path,metric_path",
     [("fixtures/shapes/canada-feature-collection.geojson", "",)],
+    ids=["canada"],
 )
 def test_throw_area_exception(shape_path, metric_path):
     # Load the geometry..
     gdf = geojson_reader(shape_path)
     assert not gdf.empty
 
-    handler = ModisFire(
+    handler = metric_handler(
+        ModisFire,
         config_filepath=abspath(__file__, "../../src/marapp_metrics/earthengine.yaml"),
         use_exceeds_limit=True,
     )
@@ -144,3 +154,86 @@ def test_throw_area_exception(shape_path, metric_path):
     # Large shape should throw an exception
     with pytest.raises(MetricComputeException):
         handler.measure(gdf, area_km2=1e18)
+
+
+@pytest.mark.basic
+@pytest.mark.parametrize(
+    "year,isoweek,bounds",
+    [
+        (2003, 1, ((2003, 4, 10),)),
+        (2004, 52, ((2004, 360, 366),)),
+        (2004, 53, ((2005, 1, 7),)),
+        (2009, 53, ((2010, 2, 8),)),
+        (2010, 52, ((2011, 1, 7),)),
+        (2014, 52, ((2014, 361, 365), (2015, 1, 2))),
+        (2015, 53, ((2016, 2, 8),)),
+        (2020, 53, ((2021, 2, 8),)),
+    ],
+    ids=[
+        "2003-1",
+        "2004-52",
+        "2004-53",
+        "2009-53",
+        "2010-52",
+        "2014-52",
+        "2015-53",
+        "2020-53",
+    ],
+)
+def test_generate_isoweeks_year_boundary(year, isoweek, bounds):
+    # No Earth Engine calls, iso-weeks are generated client-side
+    iso_weeks = _generate_isoweeks("2000-01-01", "2021-12-31")
+
+    week = next(d for d in iso_weeks if (d["year"], d["isoweek"]) == (year, isoweek))
+    assert week["bounds"] == bounds
+
+
+@pytest.mark.basic
+def test_generate_isoweeks_contiguous():
+    iso_weeks = _generate_isoweeks("2000-01-01", "2021-12-31")
+
+    # Every week covers 7 burn days, saturday to friday, with no gaps or overlaps
+    days = []
+    for d in iso_weeks:
+        week_days = [
+            date(year, 1, 1) + timedelta(days=day - 1)
+            for year, first_day, last_day in d["bounds"]
+            for day in range(first_day, last_day + 1)
+        ]
+        assert len(week_days) == 7
+        assert week_days[0].isoweekday() == 6
+        days.extend(week_days)
+
+    assert all((b - a).days == 1 for a, b in zip(days, days[1:]))
+
+    # Iso-week keys are unique
+    keys = [(d["year"], d["isoweek"]) for d in iso_weeks]
+    assert len(keys) == len(set(keys))
+
+
+@pytest.mark.basic
+@pytest.mark.parametrize(
+    "start_date,end_date",
+    [
+        ("2018-01-01", "2018-01-05"),
+        ("2018-01-01", "2018-01-01"),
+        ("2018-02-01", "2018-01-01"),
+    ],
+    ids=["short", "same-day", "reversed"],
+)
+def test_generate_isoweeks_empty_range(start_date, end_date):
+    # No Earth Engine calls, a range shorter than a week yields no iso-week
+    assert _generate_isoweeks(start_date, end_date) == ()
+
+
+@pytest.mark.basic
+def test_throw_empty_range_exception():
+    # Dates are given, so the dataset is not queried for its range
+    with pytest.raises(MetricComputeException):
+        ModisFire(
+            config_filepath=abspath(
+                __file__, "../../src/marapp_metrics/earthengine.yaml"
+            ),
+            start_date="2018-01-01",
+            end_date="2018-01-05",
+        )
@@ -23,11 +23,13 @@ import logging
 import functools
 import geopandas as gpd
 import json
-from contextlib import contextmanager
 from os import path
 
 logger = logging.getLogger()
 
+# fixture paths are given relative to the tests directory
+TESTS_ROOT = path.dirname(path.abspath(__file__))
+
 
 class DataReadException(Exception):
     pass
@@ -37,21 +39,14 @@ class GeoJSONReadException(Exception):
     pass
 
 
-@contextmanager
-def file_reader(filename):
-    relative_filename = path.join("..", path.dirname(__file__), filename)
-    file = open(relative_filename, "r")
-    try:
-        yield file
-    finally:
-        file.close()
+def fixture_path(filename):
+    return path.join(TESTS_ROOT, filename)
 
 
 def json_reader(filename, ignore_missing=False):
     try:
-        with file_reader(filename) as file:
-            data = file.read()
-            return json.loads(data)
+        with open(fixture_path(filename), "r") as file:
+            return json.load(file)
     except FileNotFoundError as e:
         if not ignore_missing:
             raise e
@@ -61,7 +56,7 @@ def json_reader(filename, ignore_missing=False):
 
 
 def json_writer(filename, data):
-    relative_filename = path.join("..", path.dirname(__file__), filename)
+    relative_filename = fixture_path(filename)
     if not os.path.isfile(relative_filename):
         directory = os.path.dirname(relative_filename)
         os.makedirs(directory, exist_ok=True)
@@ -72,28 +67,51 @@ def json_writer(filename, data):
 
 
 def geojson_reader(filename):
-    with file_reader(filename) as file:
-        try:
-            return gpd.read_file(file.name)
-        except Exception:
-            raise GeoJSONReadException(f"Could not decode GeoJSON at: {filename}")
+    """Reads a GeoJSON fixture, parsing each file once per test session."""
+
+    return _read_geojson(filename).copy()
+
+
+@functools.lru_cache(maxsize=None)
+def _read_geojson(filename):
+    # the driver opens the file itself
+    try:
+        return gpd.read_file(fixture_path(filename))
+    except Exception:
+        raise GeoJSONReadException(f"Could not decode GeoJSON at: {filename}")
+
+
+@functools.lru_cache(maxsize=None)
+def metric_handler(metric_cls, **kwargs):
+    """Returns a metric handler shared by every test using the same options."""
 
+    return metric_cls(**kwargs)
 
-def traverse_nested(value, key_path=None, sep="."):
+
+def traverse_nested(value):
     """Deeply traverse a nested dictionary while keeping the full path of the keys."""
 
-    if not key_path:
-        key_path = []
-    if isinstance(value, dict):
-        for k, v in value.items():
-            local_path = key_path[:]
-            local_path.append(k)
-            yield from traverse_nested(v, local_path)
-    else:
-        yield sep.join(key_path), value
+    stack = [((), value)]
+    while stack:
+        key_path, value = stack.pop()
+        if isinstance(value, dict):
+            # reversed so that keys pop off the stack in dict order
+            stack.extend(
+                (key_path + (k,), v) for k, v in reversed(list(value.items()))
+            )
+        else:
+            yield key_path, value
 
 
 def deepgetattr(obj, attr, default=None, sep="."):
-    """Recurse through an attribute chain to get the ultimate value."""
-
-    return functools.reduce(lambda o, key: o.get(key, default), attr.split(sep), obj)
+    """
+    Recurse through an attribute chain to get the ultimate value.
+    The chain is a tuple of keys, or a string of keys joined by sep.
+    """
+
+    keys = attr.split(sep) if isinstance(attr, str) else attr
+    for key in keys:
+        obj = obj.get(key, default)
+        if obj is default:
+            break
+    return obj